@@ -1,13 +1,35 @@
 #!/usr/bin/python
 import json
+import mmap
+import os
+import platform
 from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from typing import List
+from functools import lru_cache
+from typing import Iterable, List, Optional
+from zoneinfo import ZoneInfo
 
 import attr
-import pytz
-import requests
-from dateutil import parser
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json = json
+    # on PyPy stdlib json is faster than ujson
+    if platform.python_implementation() == 'CPython':
+        try:
+            import ujson as _json
+        except ImportError:
+            pass
+    _loads = _json.loads
+
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj).encode()
 
 # config consts
 CONFIG_FILE = 'tt-log-config.json'
@@ -45,6 +67,44 @@ class TeamTrackerLoggerError(Exception):
     pass
 
 
+def _parse_jira_ts(timestamp: str) -> datetime:
+    """
+    Parses Jira timestamp like "2019-03-20T10:15:30.123+0100". Colon is
+    inserted into UTC offset, because before Python 3.11
+    datetime.fromisoformat accepts only "+01:00" format
+    """
+    try:
+        return datetime.fromisoformat(f'{timestamp[:-2]}:{timestamp[-2:]}')
+    except ValueError:
+        from dateutil import parser
+        return parser.parse(timestamp)
+
+
+def _parse_date(date_string: str) -> datetime:
+    """
+    Parses date in ISO format with datetime.fromisoformat, other formats
+    are left to dateutil
+    """
+    try:
+        return datetime.fromisoformat(date_string)
+    except ValueError:
+        from dateutil import parser
+        return parser.parse(date_string)
+
+
+def _load_json_file(path: str):
+    """
+    Parses JSON file. With orjson it is parsed straight from memory-mapped
+    pages, without reading whole file into bytes first
+    """
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            return _loads(view)
+
+
 def make_parser():
     arg_parser = ArgumentParser('Log work time to TeamTracker')
 
@@ -64,21 +124,26 @@ def make_parser():
 
 def validate_args(args):
     def _get_event(args_string: str):
-        try:
-            title, work_time = args_string.split(":")
-            return Event(
-                title=title,
-                work_time=timedelta(minutes=int(work_time)),
-                event_type=EventType.MEETING,
-            )
-        except:
+        title, separator, work_time = args_string.rpartition(':')
+        if not separator:
             raise TeamTrackerLoggerError(f'Could not parse {args_string}')
+        try:
+            minutes = int(work_time)
+        except ValueError as e:
+            raise TeamTrackerLoggerError(
+                f'Could not parse minutes in {args_string}') from e
+        return Event(
+            title=title,
+            work_time=timedelta(minutes=minutes),
+            event_type=EventType.MEETING,
+        )
 
     if args.date_to_compare:
         try:
-            parser.parse(args.date_to_compare)
-        except:
-            raise TeamTrackerLoggerError('Could not parse date to compare')
+            _parse_date(args.date_to_compare)
+        except (ValueError, OverflowError) as e:
+            raise TeamTrackerLoggerError(
+                'Could not parse date to compare') from e
     if args.additional_meeting:
         args.additional_meeting = _get_event(args.additional_meeting)
     if args.override_meeting:
@@ -91,7 +156,7 @@ def parse_args(args=None):
     return parsed_args
 
 
-@attr.dataclass
+@attr.dataclass(frozen=True, slots=True)
 class JiraConfig:
     username: str
     password: str
@@ -101,6 +166,7 @@ class JiraConfig:
     start_work_status: str
     stop_work_status_primary: str
     stop_work_status_secondary: str
+    page_size: int = 100
 
 
 class EventType:
@@ -109,26 +175,33 @@ class EventType:
     MEETING = 3
 
 
-@attr.dataclass(repr=False, frozen=True)
+class StatusType:
+    OTHER = 0
+    START_WORK = 1
+    STOP_WORK = 2
+
+
+@attr.dataclass(repr=False, frozen=True, slots=True)
 class Event:
     work_time: timedelta
     key: str = ''
     title: str = ''
     event_type: int = EventType.OTHER
+    description: str = attr.ib(init=False, cmp=False)
+    minutes: int = attr.ib(init=False, cmp=False)
+
+    def __attrs_post_init__(self):
+        # event is frozen, so derived values are computed only once
+        object.__setattr__(self, 'description',
+                           " ".join(filter(None, [self.key, self.title])))
+        object.__setattr__(self, 'minutes',
+                           int(self.work_time.total_seconds() / 60))
 
     def __repr__(self):
         return '{} - {}'.format(self.work_time, self.description)
 
-    @property
-    def minutes(self):
-        return int(self.work_time.total_seconds() / 60)
-
-    @property
-    def description(self):
-        return " ".join(filter(None, [self.key, self.title]))
-
 
-@attr.dataclass(frozen=True)
+@attr.dataclass(frozen=True, slots=True)
 class TimeInterval:
     start: datetime
     stop: datetime
@@ -146,28 +219,35 @@ class TimeInterval:
         return self.stop - self.start
 
 
-@attr.dataclass(frozen=True)
+@attr.dataclass(frozen=True, slots=True)
 class StatusChange:
     created: datetime
     to_status: str
+    status_type: int = StatusType.OTHER
 
 
-@attr.dataclass
+@lru_cache(maxsize=4)
+def _load_config(config_file: str, mtime: float):
+    """
+    Reads and processes config file. Result is cached by file path and
+    modification time, so the file is read again only after it changes.
+    Returned dict is shared between calls and must not be modified
+    """
+    config = _load_json_file(config_file)
+    config['timezone'] = ZoneInfo(config['timezone'])
+    if config[MEETINGS]['biweekly_start_date']:
+        config[MEETINGS]['biweekly_start_date'] = _parse_date(
+            config[MEETINGS]['biweekly_start_date']).date()
+    return config
+
+
+@attr.dataclass(slots=True)
 class ConfigLoader:
     _config_file: str
 
     def process_config(self):
-        config = self.get_config_from_file()
-        config['timezone'] = pytz.timezone(config['timezone'])
-        if config[MEETINGS]['biweekly_start_date']:
-            config[MEETINGS]['biweekly_start_date'] = parser.parse(
-                config[MEETINGS]['biweekly_start_date']).date()
-        return config
-
-    def get_config_from_file(self):
-        with open(self._config_file, 'r') as f:
-            config = json.load(f)
-        return config
+        return _load_config(self._config_file,
+                            os.path.getmtime(self._config_file))
 
 
 @attr.dataclass
@@ -200,21 +280,12 @@ class MeetingsBuilder:
         ) for e in meeting_list]
 
     def _week_modifier(self, biweekly_start_date):
-        biweekly_start_date = biweekly_start_date
-        if biweekly_start_date > self._date_to_compare:
+        days_since_start = (self._date_to_compare - biweekly_start_date).days
+        if days_since_start < 0:
             raise TeamTrackerLoggerError(
                 'Fix biweekly_start_date - it should be less than date you want to log')
-        while biweekly_start_date < self._date_to_compare:
-            new_biweekly_start_date = biweekly_start_date + timedelta(days=14)
-            if new_biweekly_start_date < self._date_to_compare:
-                biweekly_start_date = new_biweekly_start_date
-            else:
-                break
-
-        return 0 if self._is_first_week(biweekly_start_date) else 5
-
-    def _is_first_week(self, biweekly_start_date):
-        return self._date_to_compare - biweekly_start_date < timedelta(days=7)
+        # days since start of current two-week cycle
+        return 0 if days_since_start % 14 < 7 else 5
 
 
 class TaskGetter:
@@ -224,9 +295,7 @@ class TaskGetter:
 
 class FileTaskGetter(TaskGetter):
     def get_tasks(self):
-        with open('results-full.json') as json_file:
-            data = json.load(json_file)
-        return data
+        return _load_json_file('results-full.json')
 
 
 @attr.dataclass
@@ -235,42 +304,85 @@ class JiraTaskGetter(TaskGetter):
 
     JIRA_URL = 'https://venturedevs.atlassian.net'
     SEARCH_ENDPOINT = JIRA_URL + '/rest/api/3/search'
+    CHANGELOG_ENDPOINT = JIRA_URL + '/rest/api/3/issue/{}/changelog'
 
-    def get_tasks(self):
-        headers = {
+    MAX_WORKERS = 8
+
+    def __attrs_post_init__(self):
+        import requests
+
+        # one session for all pages, so connections are pooled and reused
+        self._session = requests.Session()
+        self._session.auth = (self._config.username, self._config.password)
+        self._session.headers.update({
             "Accept": "application/json",
             "Content-Type": "application/json",
-        }
+        })
+
+    def get_tasks(self):
+        """
+        Fetches first page to learn total number of issues, then fetches
+        remaining pages concurrently
+        """
+        data = self._get_page(0)
+        page_size = data.get('maxResults') or self._config.page_size
+        start_ats = range(page_size, data.get('total', 0), page_size)
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for page in executor.map(self._get_page, start_ats):
+                data['issues'].extend(page['issues'])
+            truncated = [issue for issue in data['issues'] if
+                         self._has_truncated_changelog(issue)]
+            list(executor.map(self._get_full_histories, truncated))
+
+        # with open('results-full.json', 'wb') as file:
+        #     file.write(_dumps(data))
+        #     print('done')
 
-        payload = json.dumps({
+        return data
+
+    def _get_page(self, start_at: int):
+        payload = _dumps({
             "expand": [
                 "changelog"
             ],
             "jql": "project = {} AND assignee = {}".format(
                 self._config.project_abbr, self._config.assignee_name),
-            "maxResults": 100,
+            "maxResults": self._config.page_size,
             "fields": [
-                "summary",
-                "status",
-                "assignee"
+                SUMMARY,
+                self._config.status_field,
+                ASSIGNEE
             ],
-            "startAt": 0
+            "fieldsByKeys": False,
+            "startAt": start_at
         })
 
-        r = requests.request(
-            "POST",
-            self.SEARCH_ENDPOINT,
-            data=payload,
-            headers=headers,
-            auth=(self._config.username, self._config.password)
-        )
-        data = r.json()
+        r = self._session.post(self.SEARCH_ENDPOINT, data=payload)
+        return _loads(r.content)
 
-        # with open('results-full.json', 'w') as file:
-        #     file.write(json.dumps(data))
-        #     print('done')
+    @staticmethod
+    def _has_truncated_changelog(issue) -> bool:
+        """
+        Search results contain only latest histories of issue
+        """
+        changelog = issue.get(CHANGELOG) or {}
+        return changelog.get('total', 0) > len(changelog.get(HISTORIES) or ())
 
-        return data
+    def _get_full_histories(self, issue):
+        """
+        Replaces truncated histories with all histories of issue. Changelog
+        endpoint returns them from the oldest, search results from the newest
+        """
+        url = self.CHANGELOG_ENDPOINT.format(issue[KEY])
+        histories = []
+        while True:
+            r = self._session.get(url, params={'startAt': len(histories)})
+            page = _loads(r.content)
+            histories.extend(page['values'])
+            if not page['values'] or len(histories) >= page['total']:
+                break
+        histories.reverse()
+        issue[CHANGELOG][HISTORIES] = histories
 
 
 @attr.dataclass
@@ -282,69 +394,73 @@ class JiraTaskProcessor:
 
     _not_finished = 'NOT FINISHED YET'
 
+    def __attrs_post_init__(self):
+        self._date_prefix = self._date_to_compare.isoformat()
+        self._start_work_ts = self._start_work_timestamp.timestamp()
+        self._stop_work_ts = self._stop_work_timestamp.timestamp()
+        self._status_types = {
+            self._config.stop_work_status_primary: StatusType.STOP_WORK,
+            self._config.stop_work_status_secondary: StatusType.STOP_WORK,
+            self._config.start_work_status: StatusType.START_WORK,
+        }
+
     def process_jira_tasks(self, data):
-        data = self._get_tasks_for_assignee(data, self._config.assignee_name)
-        data = [self._process_task(obj)
-                for obj in data if
-                self._has_mandatory_fields(obj)]
+        tasks = self._get_tasks_for_assignee(data, self._config.assignee_name)
+        events = (self._process_task(obj) for obj in tasks)
 
-        data = self._remove_duplicates_and_errors(data)
-        return data
+        return self._remove_duplicates_and_errors(events)
 
     @staticmethod
     def _get_tasks_for_assignee(data, assignee):
         """
         Ensures that only tasks for assignee will be processed
         """
-        return [obj for obj in data['issues'] if
-                obj[FIELDS] and
-                obj[FIELDS][ASSIGNEE] and
-                obj[FIELDS][ASSIGNEE][NAME] == assignee]
+        for obj in data['issues']:
+            assignee_field = (obj.get(FIELDS) or {}).get(ASSIGNEE) or {}
+            if assignee_field.get(NAME) == assignee:
+                yield obj
 
     @staticmethod
-    def _remove_duplicates_and_errors(events: List[Event]) -> List[Event]:
+    def _remove_duplicates_and_errors(
+            events: Iterable[Optional[Event]]) -> List[Event]:
         """
-        Removes duplicates and events with work_time == None
+        Removes duplicates, tasks that could not be processed (None) and
+        events with work_time == None. Keeps order of issues
         """
-        return list(set([event for event in events if event.work_time]))
-
-    def _has_mandatory_fields(self, obj) -> bool:
-        return obj[CHANGELOG] and \
-               obj[CHANGELOG][HISTORIES] and \
-               obj[FIELDS] and \
-               obj[FIELDS][self._config.status_field] and \
-               obj[FIELDS][self._config.status_field][NAME]
+        return list(dict.fromkeys(
+            event for event in events if event and event.work_time))
 
-    def _current_status(self, issue):
-        return issue[FIELDS][self._config.status_field][NAME]
-
-    def _process_task(self, issue):
-        histories = issue[CHANGELOG][HISTORIES]
+    def _process_task(self, issue) -> Optional[Event]:
+        """
+        Returns None if issue lacks histories or status needed to process it
+        """
+        histories = (issue.get(CHANGELOG) or {}).get(HISTORIES)
+        fields = issue.get(FIELDS) or {}
+        status = fields.get(self._config.status_field) or {}
+        current_status = status.get(NAME)
+        if not histories or not current_status:
+            return None
         key = issue[KEY]
-        title = issue[FIELDS][SUMMARY]
-        current_status = self._current_status(issue)
-
-        on_date = self._intervals_on_date(histories, current_status)
-
-        limited_by_work_hours = [TimeInterval(
-            start=obj.start if obj.start > self._start_work_timestamp else \
-                self._start_work_timestamp,
-            stop=obj.stop if obj.stop < self._stop_work_timestamp or \
-                             self._stop_work_timestamp < obj.start else \
-                self._stop_work_timestamp,
-            from_status=obj.from_status,
-            to_status=obj.to_status
-        ) for obj in on_date]
-
-        durations = [obj.duration for obj in limited_by_work_hours]
-
-        work_time = sum(durations, timedelta())
+        title = fields[SUMMARY]
+
+        work_seconds = 0
+        for obj in self._intervals_on_date(histories, current_status):
+            # limit interval by work hours, compared as POSIX timestamps
+            start = obj.start.timestamp()
+            stop = obj.stop.timestamp()
+            limited_start = max(start, self._start_work_ts)
+            limited_stop = stop if stop < self._stop_work_ts or \
+                self._stop_work_ts < start else self._stop_work_ts
+            work_seconds += max(0, limited_stop - limited_start)
+        work_time = timedelta(seconds=work_seconds)
 
         return Event(work_time=work_time, key=key, title=title,
                      event_type=EventType.TASK)
 
     def _intervals_on_date(self, histories,
                            current_status: str) -> List[TimeInterval]:
+        if not self._may_be_on_date(histories, current_status):
+            return []
         status_changes_list = self._status_changes_list(histories)
         work_intervals = self._work_intervals(status_changes_list,
                                               current_status)
@@ -352,6 +468,18 @@ class JiraTaskProcessor:
                    obj.is_between(self._date_to_compare)]
         return on_date
 
+    def _may_be_on_date(self, histories, current_status: str) -> bool:
+        """
+        Compares dates at the beginning of raw timestamps (histories are
+        ordered from the newest) to skip parsing histories of tasks that
+        could not be worked on at date. Only work still in progress may
+        last from earlier days
+        """
+        if histories[-1][CREATED][:10] > self._date_prefix:
+            return False
+        return current_status == self._config.start_work_status or \
+            histories[0][CREATED][:10] >= self._date_prefix
+
     def _work_intervals(self, changes: List[StatusChange],
                         current_status: str) -> List[TimeInterval]:
         """
@@ -360,18 +488,17 @@ class JiraTaskProcessor:
         """
         if not changes:
             return []
-        start_status = self._config.start_work_status
-        stop_statuses = [self._config.stop_work_status_primary,
-                         self._config.stop_work_status_secondary]
         result = []
+        append = result.append
         for start, stop in zip(changes, changes[1:]):
-            if start.to_status == start_status and \
-                    stop.to_status in stop_statuses:
-                result.append(TimeInterval(
+            if start.status_type == StatusType.START_WORK and \
+                    stop.status_type == StatusType.STOP_WORK:
+                append(TimeInterval(
                     start.created, stop.created,
                     start.to_status, stop.to_status))
         last = changes[-1]
-        if current_status == start_status and last.to_status == start_status:
+        if current_status == self._config.start_work_status and \
+                last.status_type == StatusType.START_WORK:
             stop_timestamp = self._stop_work_timestamp if \
                 self._stop_work_timestamp > last.created else \
                 last.created + timedelta(minutes=10)
@@ -381,25 +508,41 @@ class JiraTaskProcessor:
                              last.to_status, stop.to_status))
         return result
 
-    def _is_status_history(self, obj) -> bool:
-        """ Checks if object represents status change (not comment or other
-        field update) """
-        return obj[ITEMS] and obj[ITEMS][0] and obj[ITEMS][0][
-            FIELD] == self._config.status_field
-
     def _status_changes_list(self, histories) -> List[StatusChange]:
-        return [StatusChange(created=parser.parse(obj[CREATED]),
-                             to_status=obj[ITEMS][0][TO_STRING])
-                for obj in reversed(histories) if self._is_status_history(obj)]
+        """
+        Returns status changes from the oldest. Histories representing
+        comments or other field updates are skipped
+        """
+        status_field = self._config.status_field
+        status_types = self._status_types
+        status_changes = []
+        for obj in reversed(histories):
+            items = obj[ITEMS]
+            item = items[0] if items else None
+            if item and item[FIELD] == status_field:
+                to_status = item[TO_STRING]
+                status_changes.append(StatusChange(
+                    created=_parse_jira_ts(obj[CREATED]),
+                    to_status=to_status,
+                    status_type=status_types.get(to_status,
+                                                 StatusType.OTHER)))
+        return status_changes
+
+
+def _sum_work_time(events: Iterable[Event]) -> timedelta:
+    """
+    Sums work time of events as seconds, so only one timedelta is built
+    """
+    return timedelta(
+        seconds=sum(event.work_time.total_seconds() for event in events))
 
 
 class TimeAdjuster:
     def adjust_time(self, tasks: List[Event],
                     meetings: List[Event]) -> List[Event]:
         workday_hours = timedelta(hours=WORK_HOURS)
-        all_meetings_time = sum([obj.work_time for obj in meetings],
-                                timedelta())
-        all_tasks_time = sum([obj.work_time for obj in tasks], timedelta())
+        all_meetings_time = _sum_work_time(meetings)
+        all_tasks_time = _sum_work_time(tasks)
         if all_tasks_time == timedelta(seconds=0):
             raise TeamTrackerLoggerError('No tasks to log')
         tasks_must_be_time = workday_hours - all_meetings_time
@@ -417,60 +560,45 @@ class TimeAdjuster:
         """
         Calculates proportions of tasks by work time and adjusts work time
         to be tasks_must_be_time in total. Takes care of rounding.
+        Arithmetic is done on whole seconds, timedeltas are built only for
+        result.
         :return: list of timedeltas that sum up to tasks_must_be_time
         """
-        proportions = self._proportions(tasks_times)
-        tasks_times = [tasks_must_be_time * p for p in proportions]
-        tasks_times = [self._round_timedelta(r) for r in tasks_times]
-        calculated_tasks_time = sum(tasks_times, timedelta())
-        diff_after_rounding = tasks_must_be_time - calculated_tasks_time
-        if diff_after_rounding > timedelta(seconds=0):
-            time_idx = tasks_times.index(min(tasks_times))
+        must_be_seconds = int(tasks_must_be_time.total_seconds())
+        proportions = self._proportions(
+            [obj.total_seconds() for obj in tasks_times])
+        tasks_seconds = [self._round_seconds(must_be_seconds * p)
+                         for p in proportions]
+        diff_after_rounding = must_be_seconds - sum(tasks_seconds)
+        if diff_after_rounding > 0:
+            seconds_idx = tasks_seconds.index(min(tasks_seconds))
         else:
-            time_idx = tasks_times.index(max(tasks_times))
-        tasks_times[time_idx] += diff_after_rounding
-        return tasks_times
+            seconds_idx = tasks_seconds.index(max(tasks_seconds))
+        tasks_seconds[seconds_idx] += diff_after_rounding
+        return [timedelta(seconds=obj) for obj in tasks_seconds]
 
     @staticmethod
     def _apply_new_work_time(tasks: List[Event], tasks_times: List[timedelta]):
-        new_tasks = []
-        for task, new_work_time in zip(tasks, tasks_times):
-            new_tasks.append(Event(
-                work_time=new_work_time,
-                key=task.key,
-                title=task.title,
-                event_type=task.event_type
-            ))
-        return new_tasks
+        return [attr.evolve(task, work_time=new_work_time)
+                for task, new_work_time in zip(tasks, tasks_times)]
 
     @staticmethod
-    def _round_timedelta(td: timedelta,
-                         period=timedelta(minutes=5)) -> timedelta:
+    def _round_seconds(seconds: float, period_seconds=300) -> int:
         """
-        Rounds the given timedelta by the given timedelta period
-        :param td: `timedelta` to round
-        :param period: `timedelta` period to round by.
+        Rounds the given seconds by the given period, halves are rounded up
+        :param seconds: seconds to round
+        :param period_seconds: period to round by, in seconds.
+        :return: whole seconds
         """
-        period_seconds = period.total_seconds()
-        half_period_seconds = period_seconds / 2
-        remainder = td.total_seconds() % period_seconds
-        if remainder >= half_period_seconds:
-            return timedelta(
-                seconds=td.total_seconds() + (period_seconds - remainder),
-                microseconds=0
-            )
-        else:
-            return timedelta(
-                seconds=td.total_seconds() - remainder,
-                microseconds=0
-            )
+        periods = int((seconds + period_seconds // 2) // period_seconds)
+        return periods * period_seconds
 
     @staticmethod
-    def _proportions(items: List) -> List[float]:
+    def _proportions(items: List[float]) -> List[float]:
         """
         Returns proportions of given items
         """
-        sum_of_items = sum(items, timedelta())
+        sum_of_items = sum(items)
         if sum_of_items == 0:
             return [0 for i in items]
         else:
@@ -487,18 +615,30 @@ class TeamTrackerLogger:
     TT_URL = 'https://teamtrack.venturedevs.com'
     LOG_ENDPOINT = TT_URL + '/api/project_logs/'
 
+    MAX_WORKERS = 8
+
+    def __attrs_post_init__(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # one session for all posts, so TCP/TLS connections are reused
+        self._session = requests.Session()
+        self._session.mount(self.TT_URL,
+                            HTTPAdapter(pool_maxsize=self.MAX_WORKERS))
+        self._session.headers.update(self._headers())
+
     def post_log(self, events: List[Event]):
-        for event in events:
-            if event.work_time > timedelta(seconds=0):
-                payload = self._prepare_payload(
-                    event.description,
-                    event.minutes,
-                    event.event_type
-                )
-                self._post_payload(payload)
+        payloads = [self._prepare_payload(
+            event.description,
+            event.minutes,
+            event.event_type
+        ) for event in events if event.work_time > timedelta(seconds=0)]
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            # consume results, so errors from posting are raised here
+            list(executor.map(self._post_payload, payloads))
 
     def _prepare_payload(self, description, minutes, event_type):
-        payload = json.dumps({
+        payload = _dumps({
             "description": description,
             "minutes": minutes,
             "when": self._when.isoformat(),
@@ -515,30 +655,36 @@ class TeamTrackerLogger:
         return headers
 
     def _post_payload(self, payload):
-        r = requests.request(
-            "POST",
-            self.LOG_ENDPOINT,
-            data=payload,
-            headers=self._headers(),
-        )
+        r = self._session.post(self.LOG_ENDPOINT, data=payload)
+
+
+def _print_events(events: List[Event], title_attr: str):
+    """
+    Prints events in one pass, collecting their total work time and titles
+    :return: total work time and titles joined with commas
+    """
+    work_seconds = 0
+    titles = []
+    for event in events:
+        print(event)
+        work_seconds += event.work_time.total_seconds()
+        titles.append(getattr(event, title_attr))
+    return timedelta(seconds=work_seconds), ", ".join(titles)
 
 
 def print_log(tasks, meetings):
     print('\n')
-    for event in tasks + meetings:
-        print(event)
+    all_tasks_time, all_tasks_title = _print_events(tasks, 'key')
+    all_meetings_time, all_meetings_title = _print_events(
+        meetings, 'description')
     print(('\n'))
-    all_meetings_time = sum([obj.work_time for obj in meetings], timedelta())
-    all_tasks_time = sum([obj.work_time for obj in tasks], timedelta())
-    all_meetings_title = ", ".join([event.description for event in meetings])
-    all_tasks_title = ", ".join([event.key for event in tasks])
     print('{} - {}'.format(all_tasks_time, all_tasks_title))
     print('{} - {}'.format(all_meetings_time, all_meetings_title))
 
 
 def get_date_to_compare(args, timezone):
     if args.date_to_compare:
-        return timezone.localize(parser.parse(args.date_to_compare))
+        return _parse_date(args.date_to_compare).replace(tzinfo=timezone)
     else:
         return datetime.now(timezone)
 
@@ -589,7 +735,7 @@ def main():
     tasks = processor.process_jira_tasks(tasks)
 
     if args.yolo:
-        all_tasks_time = sum([obj.work_time for obj in tasks], timedelta())
+        all_tasks_time = _sum_work_time(tasks)
         if all_tasks_time == timedelta(seconds=0):
             tasks = handle_yolo_with_no_tasks(jira_config.project_abbr)
 